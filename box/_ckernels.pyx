@@ -0,0 +1,158 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Cython build of the hot geometry kernels.
+
+Ahead-of-time counterpart to the Numba kernels in _nkernels.py: same
+functions, same signatures, but compiled at install time so the simulator
+starts without any JIT warmup. Keep the two files in sync.
+"""
+
+from libc.math cimport atan2, sqrt
+
+
+def point_in_box(
+    double ax,
+    double ay,
+    double bx,
+    double by,
+    double abx,
+    double aby,
+    double bcx,
+    double bcy,
+    double dot_ab,
+    double dot_bc,
+    double mx,
+    double my,
+):
+    """Is point (mx, my) inside the box described by corner A/B and edges AB/BC."""
+    cdef double t1 = abx * (mx - ax) + aby * (my - ay)
+    cdef double t2 = bcx * (mx - bx) + bcy * (my - by)
+    return (0 <= t1 <= dot_ab) and (0 <= t2 <= dot_bc)
+
+
+def boxes_mask(double[:, :] args, double x, double y):
+    """Bitmask of which kernel-argument rows describe a box containing (x, y).
+
+    Each row holds one box's (ax, ay, bx, by, abx, aby, bcx, bcy, dot_ab,
+    dot_bc) pack; bit i of the result is set when row i contains the point.
+    Returning a bitmask keeps the scan allocation-free but caps the scan at
+    63 rows (BoxEnv enforces the limit at construction); long long rather
+    than long because the latter is 32-bit on Windows.
+    """
+    cdef Py_ssize_t i
+    cdef long long mask = 0
+    cdef double t1, t2
+    for i in range(args.shape[0]):
+        t1 = args[i, 4] * (x - args[i, 0]) + args[i, 5] * (y - args[i, 1])
+        t2 = args[i, 6] * (x - args[i, 2]) + args[i, 7] * (y - args[i, 3])
+        if (0 <= t1 <= args[i, 8]) and (0 <= t2 <= args[i, 9]):
+            mask |= <long long>1 << i
+    return mask
+
+
+def close_enough_xy(double ax, double ay, double bx, double by, double threshold):
+    """Is point (ax, ay) within threshold distance of point (bx, by)."""
+    cdef double dx = ax - bx
+    cdef double dy = ay - by
+    return dx * dx + dy * dy < threshold * threshold
+
+
+def advance_in_box(
+    double px,
+    double py,
+    double cos_rot,
+    double sin_rot,
+    double increment,
+    double ax,
+    double ay,
+    double bx,
+    double by,
+    double abx,
+    double aby,
+    double bcx,
+    double bcy,
+    double dot_ab,
+    double dot_bc,
+):
+    """Advance (px, py) along the heading and test the result in one pass.
+
+    Fuses the move_forward/move_backward displacement with the containment
+    projections so a step is a single compiled call. Pass a negative
+    increment to step backward.
+    """
+    cdef double nx = px + increment * cos_rot
+    cdef double ny = py + increment * sin_rot
+    cdef double t1 = abx * (nx - ax) + aby * (ny - ay)
+    cdef double t2 = bcx * (nx - bx) + bcy * (ny - by)
+    return ((0 <= t1 <= dot_ab) and (0 <= t2 <= dot_bc)), nx, ny
+
+
+def perfect_step(
+    double px,
+    double py,
+    double cos_rot,
+    double sin_rot,
+    double tx,
+    double ty,
+    double cos_half_wedge,
+    double increment,
+    double cos_inc,
+    double sin_inc,
+    double ax,
+    double ay,
+    double bx,
+    double by,
+    double abx,
+    double aby,
+    double bcx,
+    double bcy,
+    double dot_ab,
+    double dot_bc,
+):
+    """One full perfect-navigator step fused into a single compiled call.
+
+    Selects the correct action (forward within the target wedge, otherwise a
+    turn toward the target) and applies it: a forward step is advanced and
+    containment-checked like advance_in_box, a turn advances the cos/sin pair
+    with the angle-addition recurrence. Action codes match the Action enum
+    (0 forward, 2 rotate left, 3 rotate right).
+
+    Returns:
+        (action, valid_move, px, py, cos_rot, sin_rot, dot, det)
+    """
+    cdef double dx = tx - px
+    cdef double dy = ty - py
+    cdef double dot = cos_rot * dx + sin_rot * dy
+    cdef double det = cos_rot * dy - sin_rot * dx
+    cdef double nx, ny, t1, t2, new_cos, new_sin
+
+    if dot >= cos_half_wedge * sqrt(dx * dx + dy * dy):
+        nx = px + increment * cos_rot
+        ny = py + increment * sin_rot
+        t1 = abx * (nx - ax) + aby * (ny - ay)
+        t2 = bcx * (nx - bx) + bcy * (ny - by)
+        if (0 <= t1 <= dot_ab) and (0 <= t2 <= dot_bc):
+            return 0, True, nx, ny, cos_rot, sin_rot, dot, det
+        return 0, False, px, py, cos_rot, sin_rot, dot, det
+
+    if det > 0:
+        # Rotate left
+        new_cos = cos_rot * cos_inc - sin_rot * sin_inc
+        new_sin = sin_rot * cos_inc + cos_rot * sin_inc
+        return 2, False, px, py, new_cos, new_sin, dot, det
+
+    # Rotate right
+    new_cos = cos_rot * cos_inc + sin_rot * sin_inc
+    new_sin = sin_rot * cos_inc - cos_rot * sin_inc
+    return 3, False, px, py, new_cos, new_sin, dot, det
+
+
+def angle_to_target(
+    double cos_rot, double sin_rot, double tx, double ty, double px, double py
+):
+    """Signed angle between heading (cos_rot, sin_rot) and the target direction.
+
+    atan2 is scale invariant, so the target vector never needs normalizing.
+    """
+    cdef double dx = tx - px
+    cdef double dy = ty - py
+    return atan2(cos_rot * dy - sin_rot * dx, cos_rot * dx + sin_rot * dy)
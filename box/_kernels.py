@@ -0,0 +1,35 @@
+"""Dispatcher for the compiled geometry kernels.
+
+The Cython extension (built from _ckernels.pyx via setup.py) is preferred
+because it loads instantly; the Numba versions in _nkernels.py are the
+fallback and pay a one-time JIT/compile-cache cost at import. Both expose the
+same functions with identical signatures and semantics.
+"""
+
+try:
+    from ._ckernels import (
+        advance_in_box,
+        angle_to_target,
+        boxes_mask,
+        close_enough_xy,
+        perfect_step,
+        point_in_box,
+    )
+except ImportError:
+    from ._nkernels import (
+        advance_in_box,
+        angle_to_target,
+        boxes_mask,
+        close_enough_xy,
+        perfect_step,
+        point_in_box,
+    )
+
+__all__ = [
+    "advance_in_box",
+    "angle_to_target",
+    "boxes_mask",
+    "close_enough_xy",
+    "perfect_step",
+    "point_in_box",
+]
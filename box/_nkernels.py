@@ -0,0 +1,179 @@
+"""Numba-compiled kernels for the hot geometry primitives.
+
+These operate on raw floats so that the per-step geometry (containment and
+distance checks) runs as native code instead of Python-level method dispatch.
+"""
+
+from math import atan2, sqrt
+
+from numba import njit
+
+# The geometry is fixed at 2D float64, so give every kernel an explicit
+# signature; compilation then happens once at import instead of lazily on the
+# first call with type dispatch
+@njit(
+    "b1(f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8)",
+    cache=True,
+    fastmath=True,
+    boundscheck=False,
+)
+def point_in_box(
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    abx: float,
+    aby: float,
+    bcx: float,
+    bcy: float,
+    dot_ab: float,
+    dot_bc: float,
+    mx: float,
+    my: float,
+) -> bool:
+    """Is point (mx, my) inside the box described by corner A/B and edges AB/BC."""
+    t1 = abx * (mx - ax) + aby * (my - ay)
+    t2 = bcx * (mx - bx) + bcy * (my - by)
+    return (0 <= t1 <= dot_ab) and (0 <= t2 <= dot_bc)
+
+
+@njit("i8(f8[:,:],f8,f8)", cache=True, fastmath=True, boundscheck=False)
+def boxes_mask(args, x, y) -> int:
+    """Bitmask of which kernel-argument rows describe a box containing (x, y).
+
+    Each row holds one box's (ax, ay, bx, by, abx, aby, bcx, bcy, dot_ab,
+    dot_bc) pack; bit i of the result is set when row i contains the point.
+    Returning a bitmask keeps the scan allocation-free but caps the scan at
+    63 rows; BoxEnv enforces the limit at construction so an oversized map
+    fails loudly instead of corrupting queries.
+    """
+    mask = 0
+    for i in range(args.shape[0]):
+        t1 = args[i, 4] * (x - args[i, 0]) + args[i, 5] * (y - args[i, 1])
+        t2 = args[i, 6] * (x - args[i, 2]) + args[i, 7] * (y - args[i, 3])
+        if (0 <= t1 <= args[i, 8]) and (0 <= t2 <= args[i, 9]):
+            mask |= 1 << i
+    return mask
+
+
+@njit("b1(f8,f8,f8,f8,f8)", cache=True, fastmath=True, boundscheck=False)
+def close_enough_xy(ax: float, ay: float, bx: float, by: float, threshold: float) -> bool:
+    """Is point (ax, ay) within threshold distance of point (bx, by)."""
+    dx = ax - bx
+    dy = ay - by
+    return dx * dx + dy * dy < threshold * threshold
+
+
+@njit(
+    "Tuple((b1,f8,f8))(f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8)",
+    cache=True,
+    fastmath=True,
+    boundscheck=False,
+)
+def advance_in_box(
+    px: float,
+    py: float,
+    cos_rot: float,
+    sin_rot: float,
+    increment: float,
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    abx: float,
+    aby: float,
+    bcx: float,
+    bcy: float,
+    dot_ab: float,
+    dot_bc: float,
+) -> tuple[bool, float, float]:
+    """Advance (px, py) along the heading and test the result in one pass.
+
+    Fuses the move_forward/move_backward displacement with the containment
+    projections so a step is a single compiled call. Pass a negative
+    increment to step backward.
+    """
+    nx = px + increment * cos_rot
+    ny = py + increment * sin_rot
+    t1 = abx * (nx - ax) + aby * (ny - ay)
+    t2 = bcx * (nx - bx) + bcy * (ny - by)
+    return ((0 <= t1 <= dot_ab) and (0 <= t2 <= dot_bc)), nx, ny
+
+
+@njit(
+    "Tuple((i8,b1,f8,f8,f8,f8,f8,f8))"
+    "(f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8)",
+    cache=True,
+    fastmath=True,
+    boundscheck=False,
+)
+def perfect_step(
+    px: float,
+    py: float,
+    cos_rot: float,
+    sin_rot: float,
+    tx: float,
+    ty: float,
+    cos_half_wedge: float,
+    increment: float,
+    cos_inc: float,
+    sin_inc: float,
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    abx: float,
+    aby: float,
+    bcx: float,
+    bcy: float,
+    dot_ab: float,
+    dot_bc: float,
+) -> tuple[int, bool, float, float, float, float, float, float]:
+    """One full perfect-navigator step fused into a single compiled call.
+
+    Selects the correct action (forward within the target wedge, otherwise a
+    turn toward the target) and applies it: a forward step is advanced and
+    containment-checked like advance_in_box, a turn advances the cos/sin pair
+    with the angle-addition recurrence. Action codes match the Action enum
+    (0 forward, 2 rotate left, 3 rotate right).
+
+    Returns:
+        (action, valid_move, px, py, cos_rot, sin_rot, dot, det)
+    """
+    dx = tx - px
+    dy = ty - py
+    dot = cos_rot * dx + sin_rot * dy
+    det = cos_rot * dy - sin_rot * dx
+
+    if dot >= cos_half_wedge * sqrt(dx * dx + dy * dy):
+        nx = px + increment * cos_rot
+        ny = py + increment * sin_rot
+        t1 = abx * (nx - ax) + aby * (ny - ay)
+        t2 = bcx * (nx - bx) + bcy * (ny - by)
+        if (0 <= t1 <= dot_ab) and (0 <= t2 <= dot_bc):
+            return 0, True, nx, ny, cos_rot, sin_rot, dot, det
+        return 0, False, px, py, cos_rot, sin_rot, dot, det
+
+    if det > 0:
+        # Rotate left
+        new_cos = cos_rot * cos_inc - sin_rot * sin_inc
+        new_sin = sin_rot * cos_inc + cos_rot * sin_inc
+        return 2, False, px, py, new_cos, new_sin, dot, det
+
+    # Rotate right
+    new_cos = cos_rot * cos_inc + sin_rot * sin_inc
+    new_sin = sin_rot * cos_inc - cos_rot * sin_inc
+    return 3, False, px, py, new_cos, new_sin, dot, det
+
+
+@njit("f8(f8,f8,f8,f8,f8,f8)", cache=True, fastmath=True, boundscheck=False)
+def angle_to_target(
+    cos_rot: float, sin_rot: float, tx: float, ty: float, px: float, py: float
+) -> float:
+    """Signed angle between heading (cos_rot, sin_rot) and the target direction.
+
+    atan2 is scale invariant, so the target vector never needs normalizing.
+    """
+    dx = tx - px
+    dy = ty - py
+    return atan2(cos_rot * dy - sin_rot * dx, cos_rot * dx + sin_rot * dy)
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from math import atan2, degrees, sqrt
+from math import atan2, cos, degrees, hypot, sin
+
+import numpy as np
+
+from ._kernels import close_enough_xy, point_in_box
 
 tup2 = tuple[float, float]
 
@@ -9,7 +13,11 @@ Box.py defines a set of classes and functions to work with 2D geometric points (
 This uses a 2D Cartesian coordinate system. 
 """
 
-def approx_equal(a: float, b: float, threshold: float = 0.0001) -> bool:
+# Default tolerance for approximate float comparisons
+_APPROX_EPS = 0.0001
+
+
+def approx_equal(a: float, b: float, threshold: float = _APPROX_EPS) -> bool:
     """
     Compare two floats and return true if they are approximately equal.
     
@@ -36,13 +44,31 @@ def close_enough(A: Pt, B: Pt, threshold: float) -> bool:
         bool: Is Pt A close enough to Pt B given a threshold
     """
     # TODO: find good threshold value
-    distance = (A - B).magnitude()
-    return distance < threshold
+    return close_enough_xy(A.x, A.y, B.x, B.y, threshold)
+
+
+def close_enough_sq(A: Pt, B: Pt, threshold_sq: float) -> bool:
+    """Like close_enough, but against a pre-squared threshold (avoids the sqrt).
+
+    Args:
+        A (Pt): First Pt to compare
+        B (Pt): Second Pt to compare
+        threshold_sq (float): square of the max distance for being "close"
+
+    Returns:
+        bool: Is the squared distance between A and B less than the threshold
+    """
+    dx = A.x - B.x
+    dy = A.y - B.y
+    return dx * dx + dy * dy < threshold_sq
 
 
 class Pt:
     """Defines the x and y values of a point in R^2."""
 
+    # Hot paths create many short-lived Pts; slots avoid the per-instance dict
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float, y: float):
         """Create a new point with the given x and y coordinate values."""
         self.x = x
@@ -59,7 +85,7 @@ class Pt:
 
     def magnitude(self) -> float:
         """Find the magnitude as a 2D vector."""
-        return sqrt(self.x * self.x + self.y * self.y)
+        return hypot(self.x, self.y)
 
     def angle_between(self, other: Pt) -> float:
         """Calculate radian value of the angle between two points (current Pt and other Pt)."""
@@ -79,7 +105,11 @@ class Pt:
 
     def __eq__(self, other: Pt) -> bool:
         """Is this Pt's x and y coordinates close to another Pt."""
-        return approx_equal(self.x, other.x) and approx_equal(self.y, other.y)
+        # Inlined approx_equal to avoid two function calls per compare
+        return abs(self.x - other.x) < _APPROX_EPS and abs(self.y - other.y) < _APPROX_EPS
+
+    # Approximate equality is incompatible with hashing; be explicit about it
+    __hash__ = None
 
     def __str__(self) -> str:
         return f"({self.x}, {self.y})"
@@ -97,7 +127,7 @@ class Pt:
     @classmethod
     def distance(cls, A: Pt, B: Pt) -> float:
         """Distance between two points."""
-        return sqrt((A.x - B.x) ** 2 + (A.y - B.y) ** 2)
+        return hypot(A.x - B.x, A.y - B.y)
 
 
 class Box:
@@ -116,36 +146,110 @@ class Box:
         self.C = upper_right
         self.target = target
 
-        self.AB = self.B - self.A
-        self.dotAB = Pt.scalar_product(self.AB, self.AB)
+        # Stack the corners into a (3, 2) array so that the edge vectors and
+        # their dot products come out of a few NumPy operations instead of a
+        # cascade of temporary Pt objects
+        self._corners = np.array(
+            [self.A.xy(), self.B.xy(), self.C.xy()], dtype=np.float64
+        )
+        self._edges = self._corners[1:] - self._corners[:-1]  # Rows are AB and BC
+        self.dotAB, self.dotBC = (self._edges * self._edges).sum(axis=1)
+
+        # Cache the corner and edge components as plain floats so that the
+        # compiled containment kernel can be called without unpacking arrays
+        self._ax, self._ay = self.A.x, self.A.y
+        self._bx, self._by = self.B.x, self.B.y
+        self._abx, self._aby = self._edges[0]
+        self._bcx, self._bcy = self._edges[1]
+
+        # Most boxes come from aligned_box; for those, containment reduces to
+        # four comparisons against the bounds with no multiplies
+        self._axis_aligned = (self._abx == 0 and self._bcy == 0) or (
+            self._aby == 0 and self._bcx == 0
+        )
 
-        self.BC = self.C - self.B
-        self.dotBC = Pt.scalar_product(self.BC, self.BC)
+        # Argument pack for the compiled kernels in _kernels.py
+        self._kernel_args = (
+            self._ax,
+            self._ay,
+            self._bx,
+            self._by,
+            self._abx,
+            self._aby,
+            self._bcx,
+            self._bcy,
+            self.dotAB,
+            self.dotBC,
+        )
 
-        # Used for drawing
-        self.left = min(self.A.x, self.B.x, self.C.x)
-        self.lower = min(self.A.y, self.B.y, self.C.y)
-        self.upper = max(self.A.y, self.B.y, self.C.y)
-        self.right = max(self.A.x, self.B.x, self.C.x)
+        # Used for drawing; bounds and edge lengths come from one NumPy pass
+        # over the stacked corners (np.hypot is a single vectorized C call)
+        self.left, self.lower = self._corners.min(axis=0)
+        self.right, self.upper = self._corners.max(axis=0)
         self.origin = (self.left, self.lower)
-        self.width = Pt.distance(self.B, self.C)
-        self.height = Pt.distance(self.A, self.B)
-        self.angle_degrees = degrees(atan2(self.B.x - self.A.x, self.B.y - self.A.y))
+        self.height, self.width = np.hypot(self._edges[:, 0], self._edges[:, 1])
+        self.angle_degrees = degrees(atan2(self._abx, self._aby))
+
+        # Partial evaluation for axis-aligned boxes: exec a predicate with
+        # this box's bounds baked in as bytecode constants, and bind it over
+        # the contains_xy method so the hot containment check skips the
+        # _axis_aligned branch and the four attribute loads
+        if self._axis_aligned:
+            namespace: dict = {}
+            exec(
+                "def contains_xy(x, y):\n"
+                f"    return {float(self.left)!r} <= x <= {float(self.right)!r}"
+                f" and {float(self.lower)!r} <= y <= {float(self.upper)!r}\n",
+                namespace,
+            )
+            self.contains_xy = namespace["contains_xy"]
 
     def point_is_inside(self, M: Pt) -> bool:
         """Determine whether the point is inside of this box."""
-        AM = M - self.A
-        BM = M - self.B
-        return (0 <= Pt.scalar_product(self.AB, AM) <= self.dotAB) and (
-            0 <= Pt.scalar_product(self.BC, BM) <= self.dotBC
+        return self.contains_xy(M.x, M.y)
+
+    def points_inside(self, points: np.ndarray) -> np.ndarray:
+        """Vectorized point_is_inside for an (N, 2) array of points.
+
+        Both edge projections are computed for all points in one fused NumPy
+        pass using the stacked corner/edge arrays; the single-point path goes
+        through the compiled kernel instead.
+        """
+        rel = points[:, None, :] - self._corners[:2]  # (N, 2, 2): M-A and M-B
+        t = (rel * self._edges).sum(axis=2)  # Columns: AB.AM and BC.BM
+        return (
+            (t[:, 0] >= 0)
+            & (t[:, 0] <= self.dotAB)
+            & (t[:, 1] >= 0)
+            & (t[:, 1] <= self.dotBC)
         )
 
+    def contains_xy(self, x: float, y: float) -> bool:
+        """Like point_is_inside, but on raw coordinates (no Pt required)."""
+        if self._axis_aligned:
+            return self.left <= x <= self.right and self.lower <= y <= self.upper
+        return point_in_box(*self._kernel_args, x, y)
+
 
 def compute_angle_between_points(A: Pt, B: Pt) -> float:
     """Compute the angle between two points."""
     return
 
 
+def rotated_box(box: Box, angle: float) -> Box:
+    """Create a copy of the given box rotated by angle radians about the origin.
+
+    The corners and target are rotated together with a single 2x2 matrix
+    multiply on the stacked coordinate array, so the rotation trig is
+    computed once rather than per point.
+    """
+    c, s = cos(angle), sin(angle)
+    rotation = np.array([[c, -s], [s, c]])
+    pts = np.array([box.A.xy(), box.B.xy(), box.C.xy(), box.target.xy()])
+    out = pts @ rotation.T
+    return Box(Pt(*out[0]), Pt(*out[1]), Pt(*out[2]), Pt(*out[3]))
+
+
 def aligned_box(
     left: float, right: float, lower: float, upper: float, target: tup2
 ) -> Box:
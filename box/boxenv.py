@@ -1,8 +1,16 @@
-from matplotlib.axes import Axes
-from matplotlib.patches import Rectangle
+from __future__ import annotations
 
+from math import floor
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ._kernels import boxes_mask
 from .box import Box, Pt
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
 
 class BoxEnv:
     """A simple 2D environment of interconnected boxes.
@@ -19,20 +27,91 @@ class BoxEnv:
 
         # TODO: this doesn't work with rotated boxes; allow diagonal boxes
         padding = 100
-        min_x = min(min(b.A.x, b.B.x, b.C.x) for b in boxes)
-        max_x = max(max(b.A.x, b.B.x, b.C.x) for b in boxes)
-        min_y = min(min(b.A.y, b.B.y, b.C.y) for b in boxes)
-        max_y = max(max(b.A.y, b.B.y, b.C.y) for b in boxes)
+        corners = np.vstack([b._corners for b in boxes])
+        min_x, min_y = corners.min(axis=0)
+        max_x, max_y = corners.max(axis=0)
 
         self.xlim = (min_x - padding, max_x + padding)
         self.ylim = (min_y - padding, max_y + padding)
 
+        # Contiguous matrix of per-box kernel arguments so a compiled scan can
+        # test many boxes without touching Python objects
+        self._box_args = np.array([b._kernel_args for b in boxes], dtype=np.float64)
+
+        # Uniform grid over the environment: each cell maps to the indices of
+        # the boxes whose bounds overlap it, so a point query only has to test
+        # the few candidate boxes bucketed in its cell
+        self._cell_size = max(max(b.width, b.height) for b in boxes)
+        # Queries multiply by the reciprocal instead of dividing; build and
+        # query must bin identically, so both go through _cell_of
+        self._inv_cell_size = 1.0 / self._cell_size
+        cells: dict[tuple[int, int], list[int]] = {}
+        for i, box in enumerate(boxes):
+            min_cx, min_cy = self._cell_of(box.left, box.lower)
+            max_cx, max_cy = self._cell_of(box.right, box.upper)
+            for cx in range(min_cx, max_cx + 1):
+                for cy in range(min_cy, max_cy + 1):
+                    cells.setdefault((cx, cy), []).append(i)
+
+        # boxes_mask packs its results into a 64-bit mask, so a cell can hold
+        # at most 63 candidates; fail loudly here rather than let an
+        # oversized map silently corrupt containment queries
+        for cell, indices in cells.items():
+            if len(indices) > 63:
+                raise ValueError(
+                    f"Grid cell {cell} holds {len(indices)} overlapping boxes; "
+                    "the containment bitmask supports at most 63"
+                )
+
+        # Each cell stores its candidate indices together with their kernel
+        # arguments packed into a contiguous block for the boxes_mask kernel
+        self._grid: dict[tuple[int, int], tuple[tuple[int, ...], np.ndarray]] = {
+            cell: (tuple(indices), self._box_args[indices])
+            for cell, indices in cells.items()
+        }
+        self._empty_cell: tuple[tuple[int, ...], np.ndarray] = (
+            (),
+            np.empty((0, self._box_args.shape[1])),
+        )
+
+        # The navigator usually stays in the same cell for many consecutive
+        # queries, so remember the last cell's candidate entry
+        self._last_cell: tuple[int, int] | None = None
+        self._last_candidates = self._empty_cell
+
+    def _cell_of(self, x: float, y: float) -> tuple[int, int]:
+        """Grid cell containing the given coordinates."""
+        return floor(x * self._inv_cell_size), floor(y * self._inv_cell_size)
+
     def get_boxes_enclosing_point(self, pt: Pt) -> list[Box]:
         """Returns a list of the boxes enclosing the given point."""
-        return [box for box in self.boxes if box.point_is_inside(pt)]
+        cell = self._cell_of(pt.x, pt.y)
+        if cell != self._last_cell:
+            self._last_cell = cell
+            self._last_candidates = self._grid.get(cell, self._empty_cell)
+
+        indices, args = self._last_candidates
+        if not indices:
+            return []
+
+        # One compiled scan over the cell's candidates; bit j of the mask is
+        # set when candidate j contains the point
+        mask = boxes_mask(args, pt.x, pt.y)
+        if mask == 0:
+            return []
+        return [self.boxes[i] for j, i in enumerate(indices) if (mask >> j) & 1]
+
+    def display(self, ax: Axes, reset_limits: bool = True) -> None:
+        """Draw all boxes to the given axis.
+
+        Args:
+            ax (Axes): axis to draw the boxes onto
+            reset_limits (bool, optional): also set the axis limits and aspect;
+                pass False when the caller has already configured them (e.g.,
+                an inverted x-axis that a reset would clobber)
+        """
+        from matplotlib.patches import Rectangle
 
-    def display(self, ax: Axes) -> None:
-        """Draw all boxes to the given axis."""
         for box in self.boxes:
             ax.add_patch(
                 Rectangle(
@@ -46,7 +125,8 @@ class BoxEnv:
             )
 
             ax.plot(box.target.x, box.target.y, "bx")
-        # ax.set_xlim(self.xlim[::-1])
-        ax.set_xlim(*self.xlim)
-        ax.set_ylim(*self.ylim)
-        ax.set_aspect("equal")
+        if reset_limits:
+            # ax.set_xlim(self.xlim[::-1])
+            ax.set_xlim(*self.xlim)
+            ax.set_ylim(*self.ylim)
+            ax.set_aspect("equal")
@@ -1,15 +1,25 @@
-from enum import Enum
-from math import atan2, cos, degrees, radians, sin
-from random import choice, random, uniform
+from __future__ import annotations
 
-from matplotlib.axes import Axes
-from matplotlib.patches import Arrow, Rectangle, Wedge
+from enum import IntEnum
+from math import atan2, cos, degrees, radians, sin, sqrt
+from typing import TYPE_CHECKING
 
-from .box import Box, Pt, close_enough
+import numpy as np
+
+from ._kernels import advance_in_box, close_enough_xy, perfect_step
+from .box import Box, Pt
 from .boxenv import BoxEnv
 
+# Matplotlib is only needed when drawing, so it is imported inside the
+# display methods to keep it (and its startup cost) off headless runs
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+    from .rollout_sampler import RolloutSampler
+
 
-class Action(Enum):
+# IntEnum so that comparisons in the per-step dispatch are raw int compares
+class Action(IntEnum):
     FORWARD = 0
     BACKWARD = 1
     ROTATE_LEFT = 2
@@ -20,6 +30,14 @@ class Action(Enum):
         return self.name
 
 
+# Lookup table for correct_action indexed by (not facing) * (2 + (det > 0)):
+# 0 -> facing the target, 2/3 -> turn right/left by sign of the determinant
+_ACTIONS = (Action.FORWARD, Action.FORWARD, Action.ROTATE_RIGHT, Action.ROTATE_LEFT)
+
+# How many random draws WanderingNavigator pulls from its generator at a time
+_RNG_BUFFER_SIZE = 1024
+
+
 class BoxNavigatorBase:
     """Base class for box navigators.
 
@@ -55,40 +73,179 @@ class BoxNavigatorBase:
         self.movement_increment = movement_increment
         self.rotation_increment = rotation_increment
         self.half_target_wedge = radians(6)
+        self._cos_half_wedge = cos(self.half_target_wedge)
+
+        # Cache cos/sin of the rotation; it only changes in rotate_left/right,
+        # always by the fixed increment, so rotations advance the cached pair
+        # with the angle-addition recurrence instead of fresh trig calls
+        self._cos_inc = cos(rotation_increment)
+        self._sin_inc = sin(rotation_increment)
+        self._update_trig()
+
+        # Dot/determinant of heading vs. target direction from the most recent
+        # correct_action call (together they encode the signed angle)
+        self._dot = 1.0
+        self._det = 0.0
 
         self.actions_taken = 0
         self.stuck = False  # Can only be True in unreal wrapper
-        self.previous_target = self.position
+        self._display_ax = None  # Axis holding the persistent display artists
+        self._target_dir = None  # Memoized unit vector toward the target
+        # Copy rather than alias: moves mutate the position Pt in place
+        self.previous_target = Pt(self.position.x, self.position.y)
         self.current_box = self.env.boxes[0]  # Start in the first box
         self.dominant_direction = self.determine_direction_to_target(self.target)
         self.anchor_1 = self.rotation_anchor(self.target, self.current_box)[0]
         self.anchor_2 = self.rotation_anchor(self.target, self.current_box)[1]
 
+        # Shadow correct_action with a per-instance copy that has the wedge
+        # constant baked into its bytecode
+        self.correct_action = self._specialize_correct_action()
+
+        # Map each action to its handler once; take_action then dispatches
+        # with a single dict lookup instead of walking a match statement
+        self._dispatch = {
+            Action.FORWARD: self.move_forward,
+            Action.BACKWARD: self.move_backward,
+            Action.ROTATE_LEFT: self.rotate_left,
+            Action.ROTATE_RIGHT: self.rotate_right,
+            Action.TELEPORT: self.teleport,
+        }
+
     def at_final_target(self) -> bool:
         """Is the navigator at the final target."""
-        return close_enough(self.position, self.final_target, self.distance_threshold)
+        return close_enough_xy(
+            self.position.x,
+            self.position.y,
+            self.final_target.x,
+            self.final_target.y,
+            self.distance_threshold,
+        )
+
+    def _update_trig(self) -> None:
+        """Refresh the cached cos/sin pair after a rotation change."""
+        self._cos_rot = cos(self.rotation)
+        self._sin_rot = sin(self.rotation)
+
+    @property
+    def signed_angle_to_target(self) -> float:
+        """Signed angle between heading and target as of the last correct_action.
+
+        Derived lazily from the cached dot/determinant pair so that atan2 is
+        only paid when something (e.g., dataset filenames) asks for the angle.
+        """
+        return atan2(self._det, self._dot)
+
+    def _specialize_correct_action(self):
+        """Generate a correct_action copy with the wedge constant baked in.
+
+        half_target_wedge is fixed per navigator, so the generated function
+        carries cos(half_target_wedge) as a bytecode constant (LOAD_CONST)
+        rather than re-reading it through attribute lookups every step. The
+        plain correct_action method below stays as the reference
+        implementation; this copy shadows it on the instance.
+        """
+        source = (
+            "def _correct_action(self):\n"
+            "    hx = self._cos_rot\n"
+            "    hy = self._sin_rot\n"
+            "    tx = self.target.x - self.position.x\n"
+            "    ty = self.target.y - self.position.y\n"
+            "    dot = hx * tx + hy * ty\n"
+            "    det = hx * ty - hy * tx\n"
+            "    self._dot = dot\n"
+            "    self._det = det\n"
+            f"    facing = dot >= {self._cos_half_wedge!r} * sqrt(tx * tx + ty * ty)\n"
+            "    return ACTIONS[(not facing) * (2 + (det > 0))]\n"
+        )
+        namespace = {"sqrt": sqrt, "ACTIONS": _ACTIONS}
+        exec(source, namespace)
+        return namespace["_correct_action"].__get__(self)
 
     def correct_action(self) -> Action:
         """Compute the 'correct' action given the current position and target."""
 
-        # Compute angle between heading and target
-        heading_vector = Pt(cos(self.rotation), sin(self.rotation)).normalized()
-        target_vector = (self.target - self.position).normalized()
-        self.signed_angle_to_target = heading_vector.angle_between(target_vector)
+        # Dot and determinant of heading vs. target direction; together they
+        # carry the same information as the signed angle. Both the wedge test
+        # and the sign test are scale invariant, so the target vector is left
+        # unnormalized (no divides)
+        hx, hy = self._cos_rot, self._sin_rot
+        tx = self.target.x - self.position.x
+        ty = self.target.y - self.position.y
+        self._dot = hx * tx + hy * ty
+        self._det = hx * ty - hy * tx
+
+        # Facing the target when dot >= cos(wedge) * |t| <=> |angle| <= wedge;
+        # otherwise the sign of the determinant picks the turn direction.
+        # Table lookup keeps the selection branch-free
+        facing = self._dot >= self._cos_half_wedge * sqrt(tx * tx + ty * ty)
+        return _ACTIONS[(not facing) * (2 + (self._det > 0))]
+
+    def correct_action_batch(
+        self, positions_xy: np.ndarray, rotations: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized correct_action over a batch of sampled states.
+
+        Computes the signed heading-to-target angle for every row in one pass
+        and maps it to Action codes; useful for evaluating many Monte-Carlo
+        rollout states against the current target without a Python loop.
+
+        Args:
+            positions_xy (np.ndarray): (N, 2) array of x/y positions
+            rotations (np.ndarray): (N,) array of rotations in radians
+
+        Returns:
+            np.ndarray: (N,) array of Action codes
+        """
+        heading = np.stack([np.cos(rotations), np.sin(rotations)], axis=-1)
+        delta = np.array(self.target.xy()) - positions_xy
+        dot = (heading * delta).sum(axis=-1)
+        det = heading[:, 0] * delta[:, 1] - heading[:, 1] * delta[:, 0]
+        angles = np.arctan2(det, dot)
+        return np.where(
+            np.abs(angles) < self.half_target_wedge,
+            int(Action.FORWARD),
+            np.where(angles > 0, int(Action.ROTATE_LEFT), int(Action.ROTATE_RIGHT)),
+        )
 
-        # Already facing correct direction
-        if abs(self.signed_angle_to_target) < self.half_target_wedge:
-            action = Action.FORWARD
+    def advance_states_batch(
+        self, positions_xy: np.ndarray, rotations: np.ndarray, actions: np.ndarray
+    ) -> np.ndarray:
+        """Apply one action to every rollout state, structure-of-arrays style.
 
-        # Need to rotate left (think of unit circle); rotation indicated by positive degrees
-        elif self.signed_angle_to_target > 0:
-            action = Action.ROTATE_LEFT
+        The scalar navigator keeps its position as a Pt (per-element ndarray
+        indexing is slower than attribute access for a single agent), but
+        batched rollouts hold all state in (N, 2)/(N,) float64 arrays and
+        update it here with a handful of vectorized operations. Forward and
+        backward moves are validated against the current box exactly like the
+        scalar path; invalid moves leave the row unchanged.
 
-        # Need to rotate right (think of unit circle); rotation indicated by negative degrees
-        else:
-            action = Action.ROTATE_RIGHT
+        Args:
+            positions_xy (np.ndarray): (N, 2) array of positions, updated in place
+            rotations (np.ndarray): (N,) array of rotations, updated in place
+            actions (np.ndarray): (N,) array of Action codes
 
-        return action
+        Returns:
+            np.ndarray: (N,) bool mask of rows whose move was valid
+        """
+        forward = actions == int(Action.FORWARD)
+        backward = actions == int(Action.BACKWARD)
+        sign = forward.astype(np.float64) - backward.astype(np.float64)
+
+        headings = np.stack([np.cos(rotations), np.sin(rotations)], axis=-1)
+        candidates = positions_xy + (sign * self.movement_increment)[:, None] * headings
+
+        valid = self.current_box.points_inside(candidates)
+        moved = (forward | backward) & valid
+        positions_xy[moved] = candidates[moved]
+
+        rotations += np.where(
+            actions == int(Action.ROTATE_LEFT), self.rotation_increment, 0.0
+        )
+        rotations -= np.where(
+            actions == int(Action.ROTATE_RIGHT), self.rotation_increment, 0.0
+        )
+        return moved
 
     def num_actions_taken(self) -> int:
         return self.actions_taken
@@ -106,23 +263,14 @@ class BoxNavigatorBase:
 
         # Also compute the 'correct' action
         correct_action = self.correct_action()
-        self.valid_movement = False
-
-        match action_taken:
-            case Action.FORWARD:
-                if self.move_forward():
-                    self.valid_movement = True
-            case Action.ROTATE_LEFT:
-                self.rotate_left()
-            case Action.ROTATE_RIGHT:
-                self.rotate_right()
-            case Action.BACKWARD:
-                if self.move_backward():
-                    self.valid_movement = True
-            case Action.TELEPORT:
-                self.teleport()
-            case _:
-                raise NotImplementedError("Unknown action.")
+
+        handler = self._dispatch.get(action_taken)
+        if handler is None:
+            raise NotImplementedError("Unknown action.")
+
+        # Only the move handlers return True; rotations and teleports return
+        # None, which keeps valid_movement False as before
+        self.valid_movement = handler() is True
 
         self.actions_taken += 1
         return action_taken, correct_action, self.valid_movement
@@ -179,12 +327,19 @@ class BoxNavigatorBase:
         """Switch to next target when close enough to current target."""
         surrounding_boxes = self.env.get_boxes_enclosing_point(self.position)
         if (
-            close_enough(self.position, self.target, self.distance_threshold)
+            close_enough_xy(
+                self.position.x,
+                self.position.y,
+                self.target.x,
+                self.target.y,
+                self.distance_threshold,
+            )
             and len(surrounding_boxes) > 1
         ):
             self.previous_target = self.target
             self.target = surrounding_boxes[-1].target
             self.current_box = surrounding_boxes[-1]  # Update current box
+            self._target_dir = None
             self.dominant_direction = self.determine_direction_to_target(self.target)
             self.anchor_1 = self.rotation_anchor(self.target, self.current_box)[0]
             self.anchor_2 = self.rotation_anchor(self.target, self.current_box)[1]
@@ -199,25 +354,34 @@ class BoxNavigatorBase:
                 self.anchor_1, self.anchor_2
             )
             self.rotation = random_angle
+            self._update_trig()
         else:
             raise NotImplementedError("TeleportingNavigator is not being used.")
 
     def move_forward(self) -> bool:
         """Move forward by a fixed amount."""
-        new_x = self.position.x + self.movement_increment * cos(self.rotation)
-        new_y = self.position.y + self.movement_increment * sin(self.rotation)
-        if self.can_move_to_point(Pt(new_x, new_y)):
-            self.checked_move(Pt(new_x, new_y))
-            return True
-        else:
-            return False
+        return self._move(self.movement_increment)
 
     def move_backward(self) -> bool:
         """Move backward by a fixed amount."""
-        new_x = self.position.x - self.movement_increment * cos(self.rotation)
-        new_y = self.position.y - self.movement_increment * sin(self.rotation)
-        if self.can_move_to_point(Pt(new_x, new_y)):
-            self.checked_move(Pt(new_x, new_y))
+        return self._move(-self.movement_increment)
+
+    def _move(self, increment: float) -> bool:
+        """Step along the heading; one fused kernel call computes and checks
+        the new position."""
+        valid, new_x, new_y = advance_in_box(
+            self.position.x,
+            self.position.y,
+            self._cos_rot,
+            self._sin_rot,
+            increment,
+            *self.current_box._kernel_args,
+        )
+        if valid:
+            # Mutate the position in place rather than allocating a new Pt
+            self.position.x = new_x
+            self.position.y = new_y
+            self._target_dir = None
             return True
         return False
 
@@ -226,46 +390,126 @@ class BoxNavigatorBase:
         the current box, False otherwise."""
         return self.current_box.point_is_inside(pt)
 
-    def checked_move(self, new_pt: Pt) -> None:
-        """Move to the given position if it is within the current target box.
+    def checked_move(self, new_pt: Pt) -> bool:
+        """Move to the given position, reporting success as a bool.
+
+        No exception is raised on an out-of-bounds point; callers that care
+        (e.g., teleport region sampling already constrained to valid points)
+        check the return value instead of wrapping the call in try/except.
 
         Args:
             new_pt (Pt): The new position to move to.
+
+        Returns:
+            bool: True when the move was applied.
         """
+        if not self.can_move_to_point(new_pt):
+            return False
         self.position = new_pt
+        self._target_dir = None
+        return True
 
     def rotate_right(self) -> None:
         """Rotate to the right by a set amount."""
         self.rotation -= self.rotation_increment
+        c, s = self._cos_rot, self._sin_rot
+        self._cos_rot = c * self._cos_inc + s * self._sin_inc
+        self._sin_rot = s * self._cos_inc - c * self._sin_inc
 
     def rotate_left(self) -> None:
         """Rotate to the left by a set amount."""
         self.rotation += self.rotation_increment
+        c, s = self._cos_rot, self._sin_rot
+        self._cos_rot = c * self._cos_inc - s * self._sin_inc
+        self._sin_rot = s * self._cos_inc + c * self._sin_inc
+
+    def _refresh_target_dir(self) -> Pt:
+        """Unit vector toward the target, recomputed only after the position
+        or target has changed."""
+        if self._target_dir is None:
+            self._target_dir = (self.target - self.position).normalized()
+        return self._target_dir
+
+    def _init_artists(self, ax: Axes, scale: float) -> None:
+        """Create the persistent agent artists on their first use."""
+        from matplotlib.patches import FancyArrowPatch, Wedge
+
+        self._display_ax = ax
+        (self._agent_dot,) = ax.plot([], [], "ro")
+        self._wedge = Wedge((0, 0), scale, 0, 0, color="red")
+        ax.add_patch(self._wedge)
+        (self._target_dot,) = ax.plot([], [], "go")
+        self._target_arrow = FancyArrowPatch((0, 0), (0, 0), color="g")
+        ax.add_patch(self._target_arrow)
+        (self._anchor_dots,) = ax.plot([], [], "mx")
+
+        # Dynamic artists in draw order, for blit-style frame capture
+        self._artists = [
+            self._wedge,
+            self._agent_dot,
+            self._target_arrow,
+            self._target_dot,
+            self._anchor_dots,
+        ]
+
+    def draw_artists(self) -> None:
+        """Redraw only the dynamic artists onto the current canvas.
+
+        Used by blit-style frame capture: the caller restores a cached
+        background of the static scene and this draws just the agent's
+        artists on top, skipping a full figure render.
+        """
+        ax = self._display_ax
+        for artist in self._artists:
+            ax.draw_artist(artist)
+
+    def remove_artists(self) -> None:
+        """Remove the agent's artists from their axes.
+
+        The GIF animation path shares one cached figure across every trial in
+        the process; each finished trial must take its artists down or they
+        accumulate on the shared axes (invisible under blitting, but a leak
+        that a full canvas draw would paint).
+        """
+        if self._display_ax is None:
+            return
+        for artist in self._artists:
+            artist.remove()
+        self._artists = []
+        self._display_ax = None
 
     def display(self, ax: Axes, scale: float) -> None:
         """Plot the agent to the given axis.
 
+        The artists are created once and updated in place each frame rather
+        than re-added, which keeps per-frame work and memory flat.
+
         Args:
             ax (Axes): axis for plotting
             scale (float): scale of arrows and wedge
         """
+        if self._display_ax is not ax:
+            self._init_artists(ax, scale)
 
-        # Plot agent and agent's heading
-        ax.plot(self.position.x, self.position.y, "ro")
-        wedge_lo = degrees(self.rotation - self.half_target_wedge)
-        wedge_hi = degrees(self.rotation + self.half_target_wedge)
-        ax.add_patch(Wedge(self.position.xy(), scale, wedge_lo, wedge_hi, color="red"))
+        # Plot agent and agent's heading; read x/y once instead of repacking
+        # tuples through Pt.xy() on every frame
+        x, y = self.position.x, self.position.y
+        self._agent_dot.set_data([x], [y])
+        self._wedge.set_center((x, y))
+        self._wedge.set_theta1(degrees(self.rotation - self.half_target_wedge))
+        self._wedge.set_theta2(degrees(self.rotation + self.half_target_wedge))
 
         # Plot target and line to target
-        ax.plot(self.target.x, self.target.y, "go")
-        dxy = (self.target - self.position).normalized() * scale
-        ax.add_patch(Arrow(self.position.x, self.position.y, dxy.x, dxy.y, color="g"))
+        self._target_dot.set_data([self.target.x], [self.target.y])
+        dxy = self._refresh_target_dir() * scale
+        self._target_arrow.set_positions((x, y), (x + dxy.x, y + dxy.y))
 
         # Check if the environment is of type TeleportingNavigator
         if isinstance(self, TeleportingNavigator):
             self.draw_current_past_rectangle(ax, scale)  # Draw the rectangle
-            ax.plot(self.anchor_1.x, self.anchor_1.y, "mx")
-            ax.plot(self.anchor_2.x, self.anchor_2.y, "mx")
+            self._anchor_dots.set_data(
+                [self.anchor_1.x, self.anchor_2.x], [self.anchor_1.y, self.anchor_2.y]
+            )
 
 
 class PerfectNavigator(BoxNavigatorBase):
@@ -293,6 +537,53 @@ class PerfectNavigator(BoxNavigatorBase):
         """The perfect navigator always chooses the correct action."""
         return self.correct_action()
 
+    def take_action(self) -> tuple[Action, Action, bool]:
+        """Execute a single action in the environment.
+
+        The perfect navigator's taken and correct actions always coincide, so
+        the whole step (action selection plus the move or turn it implies) is
+        fused into one compiled kernel call instead of going through the
+        generic select-then-dispatch path.
+
+        Returns:
+            tuple[Action, Action]: return action taken and correct action.
+        """
+        self.update_target()
+
+        code, valid, px, py, cos_rot, sin_rot, dot, det = perfect_step(
+            self.position.x,
+            self.position.y,
+            self._cos_rot,
+            self._sin_rot,
+            self.target.x,
+            self.target.y,
+            self._cos_half_wedge,
+            self.movement_increment,
+            self._cos_inc,
+            self._sin_inc,
+            *self.current_box._kernel_args,
+        )
+
+        self._dot = dot
+        self._det = det
+        if valid:
+            self.position.x = px
+            self.position.y = py
+            self._target_dir = None
+        elif code == Action.ROTATE_LEFT:
+            self.rotation += self.rotation_increment
+            self._cos_rot = cos_rot
+            self._sin_rot = sin_rot
+        elif code == Action.ROTATE_RIGHT:
+            self.rotation -= self.rotation_increment
+            self._cos_rot = cos_rot
+            self._sin_rot = sin_rot
+
+        self.valid_movement = valid
+        self.actions_taken += 1
+        action = Action(code)
+        return action, action, valid
+
 
 class WanderingNavigator(BoxNavigatorBase):
     """A navigator that wanders in a directed fashion toward the end goal."""
@@ -308,6 +599,8 @@ class WanderingNavigator(BoxNavigatorBase):
         forward_increment: float,
         rotation_increment: float,
         chance_of_random_action: float = 0.25,
+        seed: int | None = None,
+        rollout_sampler: RolloutSampler | None = None,
     ) -> None:
         super().__init__(
             position,
@@ -324,14 +617,51 @@ class WanderingNavigator(BoxNavigatorBase):
         ]
 
         self.chance_of_random_action = chance_of_random_action
+        # The random-or-correct decision compares raw uint64 draws against a
+        # precomputed integer threshold, skipping the float conversion the
+        # generator would otherwise do for every draw
+        self._random_threshold = int(chance_of_random_action * 2**64)
+
+        # PCG64 is faster than the random module's Mersenne Twister, and
+        # drawing decisions a block at a time amortizes the per-call overhead
+        self._rng = np.random.default_rng(seed)
+        self._rng_index = _RNG_BUFFER_SIZE
+
+        # Optional shared sampler that spreads parallel rollouts apart
+        self.rollout_sampler = rollout_sampler
+
+    def _refill_rng_buffers(self) -> None:
+        """Pre-draw the next block of random decisions."""
+        self._draw_buffer = self._rng.integers(
+            0, 2**64, _RNG_BUFFER_SIZE, dtype=np.uint64
+        )
+        self._choice_buffer = self._rng.integers(
+            0, len(self.possible_actions), _RNG_BUFFER_SIZE
+        )
+        self._rng_index = 0
 
     def navigator_specific_action(self) -> Action:
         # Take a random action some percent of the time
-        return (
-            choice(self.possible_actions)
-            if random() < self.chance_of_random_action
-            else self.correct_action()
-        )
+        index = self._rng_index
+        if index == _RNG_BUFFER_SIZE:
+            self._refill_rng_buffers()
+            index = 0
+        self._rng_index = index + 1
+
+        draw = self._draw_buffer[index]
+        if draw < self._random_threshold:
+            if self.rollout_sampler is not None:
+                # The draw is uniform below the threshold, so rescaling it
+                # gives a free uniform value for the weighted pick
+                key = self.rollout_sampler.state_key(self.target, self.rotation)
+                pick = self.rollout_sampler.sample(
+                    key,
+                    len(self.possible_actions),
+                    int(draw) / self._random_threshold,
+                )
+                return self.possible_actions[pick]
+            return self.possible_actions[self._choice_buffer[index]]
+        return self.correct_action()
 
 
 class TeleportingNavigator(BoxNavigatorBase):
@@ -345,6 +675,7 @@ class TeleportingNavigator(BoxNavigatorBase):
         distance_threshold: int,
         forward_increment: float,
         rotation_increment: float,
+        seed: int | None = None,
         # ahead_box=None,
     ) -> None:
         super().__init__(
@@ -358,6 +689,10 @@ class TeleportingNavigator(BoxNavigatorBase):
         # Give variables more descriptive names
         self.possible_actions = [Action.TELEPORT]
 
+        # Per-navigator PCG64 generator; the random module's global Mersenne
+        # Twister is slower and shared across everything in the process
+        self._rng = np.random.default_rng(seed)
+
         # self.ahead_box = None
         self.counter = 1
         self.box_size = 50
@@ -365,6 +700,10 @@ class TeleportingNavigator(BoxNavigatorBase):
         self.counter = 0
         self.pause_box = False
 
+        # Persistent display patches (created on first draw)
+        self._ahead_patch = None
+        self._past_patch = None
+
     def navigator_specific_action(self) -> Action:
         return Action.TELEPORT
 
@@ -453,37 +792,53 @@ class TeleportingNavigator(BoxNavigatorBase):
 
     def draw_rectangle_ahead(self, ax: Axes, scale: float) -> None:
         """Draw a rectangle ahead of the agent's current location."""
+        from matplotlib.patches import Rectangle
 
         self.set_ahead_box()
 
-        # Add the rectangle patch to the plot
-        ax.add_patch(
-            Rectangle(
-                self.ahead_box.origin,
-                self.ahead_box.width,
-                self.ahead_box.height,
-                angle=self.ahead_box.angle_degrees,
-                facecolor="orange",  # Color of the rectangle
-                alpha=0.6,  # Transparency level of the rectangle
-            )
+        # Create the patch once, then just move/reshape it each frame
+        if self._ahead_patch is None:
+            self._ahead_patch = Rectangle((0, 0), 1, 1, facecolor="orange", alpha=0.6)
+            ax.add_patch(self._ahead_patch)
+            # Keep the region patches beneath the agent artists when blitting
+            self._artists.insert(0, self._ahead_patch)
+
+        self._ahead_patch.set_bounds(
+            self.ahead_box.left,
+            self.ahead_box.lower,
+            self.ahead_box.width,
+            self.ahead_box.height,
         )
+        self._ahead_patch.set_angle(self.ahead_box.angle_degrees)
 
     def draw_current_past_rectangle(self, ax: Axes, scale: float) -> None:
         """Draw a rectangle ahead of the agent's current location and it's current box."""
-        if self.counter == 1:
-            self.draw_rectangle_ahead(ax, scale)
-        else:
-            self.draw_rectangle_ahead(ax, scale)
-            ax.add_patch(
-                Rectangle(
-                    self.temp_box.origin,
-                    self.temp_box.width,
-                    self.temp_box.height,
-                    angle=self.temp_box.angle_degrees,
-                    facecolor="yellow",  # Color of the rectangle
-                    alpha=0.6,  # Transparency level of the rectangle
-                )
+        from matplotlib.patches import Rectangle
+
+        self.draw_rectangle_ahead(ax, scale)
+
+        if self._past_patch is None:
+            self._past_patch = Rectangle((0, 0), 1, 1, facecolor="yellow", alpha=0.6)
+            ax.add_patch(self._past_patch)
+            self._artists.insert(0, self._past_patch)
+
+        # There is no past box to show until after the first teleport
+        self._past_patch.set_visible(self.counter != 1)
+        if self.counter != 1:
+            self._past_patch.set_bounds(
+                self.temp_box.left,
+                self.temp_box.lower,
+                self.temp_box.width,
+                self.temp_box.height,
             )
+            self._past_patch.set_angle(self.temp_box.angle_degrees)
+
+    def remove_artists(self) -> None:
+        super().remove_artists()
+        # The region patches were removed with the rest of _artists; clear
+        # them so a later display() recreates rather than reuses them
+        self._ahead_patch = None
+        self._past_patch = None
 
     def random_point_within_teleport_region(
         self,
@@ -492,16 +847,16 @@ class TeleportingNavigator(BoxNavigatorBase):
         if self.counter == 1:
             return Pt(self.position.x, self.position.y)
         else:
-            x = uniform(self.ahead_box.left, self.ahead_box.right)
-            y = uniform(self.ahead_box.lower, self.ahead_box.upper)
+            x = self._rng.uniform(self.ahead_box.left, self.ahead_box.right)
+            y = self._rng.uniform(self.ahead_box.lower, self.ahead_box.upper)
 
             # Create a random point
             random_pt = Pt(x, y)
             return random_pt
 
     def random_rotation_within_target_cone(self, anchor_1: Pt, anchor_2: Pt) -> float:
-        random_x = uniform(anchor_1.x, anchor_2.x)
-        random_y = uniform(anchor_1.y, anchor_2.y)
+        random_x = self._rng.uniform(anchor_1.x, anchor_2.x)
+        random_y = self._rng.uniform(anchor_1.y, anchor_2.y)
         angle = atan2(random_y - self.position.y, random_x - self.position.x)
         return angle
 
@@ -516,8 +871,8 @@ class TeleportingNavigator(BoxNavigatorBase):
             )
         else:
             # Calculate a random point between anchor_1 and anchor_2
-            random_x = uniform(anchor_1.x, anchor_2.x)
-            random_y = uniform(anchor_1.y, anchor_2.y)
+            random_x = self._rng.uniform(anchor_1.x, anchor_2.x)
+            random_y = self._rng.uniform(anchor_1.y, anchor_2.y)
 
             # calculate the angle from the agent to this random_point and use this as our angle
             angle = atan2(random_y - self.position.y, random_x - self.position.x)
@@ -1,12 +1,15 @@
-from math import degrees
+from math import pi
 from pathlib import Path
-from time import sleep
+from time import monotonic, sleep
 
 from ue5osc import Communicator
 
 from .box import Pt
 from .boxnavigator import Action, BoxNavigatorBase
 
+# Cheaper than a math.degrees call in the per-step sync paths
+_RAD_TO_DEG = 180.0 / pi
+
 
 class UENavigatorWrapper:
     """A wrapper for navigators that facilitates coordination with UnrealEngine 5."""
@@ -36,10 +39,34 @@ class UENavigatorWrapper:
         self.trial_num = trial_num
         self.images_saved = 1
         self.image_ext = image_ext
+        # Filename pieces that never change between frames
+        self._image_ext_lower = str(image_ext).lower()
+        self._image_prefix = f"{self.dataset_path}/{trial_num:03}_"
         self.num_stationary_moves = 0
         self.distance_moved = [0, 0]
         self.stuck = False
 
+        # Yaw from buffered rotations not yet sent to UE (see take_action)
+        self._pending_yaw: float | None = None
+
+        # Time before which the UE frame buffer is not ready for the next
+        # image capture (see save_image)
+        self._capture_deadline = 0.0
+
+        # Newer ue5osc builds expose a composite command that runs the raycast
+        # check, the conditional move, and the location read in one OSC
+        # round-trip instead of three; use it when available
+        self._composite_step = getattr(self.ue, "step_forward_with_raycast", None)
+
+        # One dict lookup per step instead of an if/elif chain over actions
+        self._ue_dispatch = {
+            Action.FORWARD: self._ue_forward,
+            Action.BACKWARD: self._ue_backward,
+            Action.ROTATE_LEFT: self._ue_rotate,
+            Action.ROTATE_RIGHT: self._ue_rotate,
+            Action.TELEPORT: self._ue_teleport,
+        }
+
         try:
             # Sync UE and boxsim
             self.sync_positions()
@@ -83,10 +110,9 @@ class UENavigatorWrapper:
         # Get z position from UE
         _, _, unreal_z = self.ue.get_location()
 
-        # Get x, y position from boxsim
-        x, y = self.navigator.position.xy()
-
-        self.ue.set_location(x, y, unreal_z)
+        # Get x, y position from boxsim (attribute reads, no tuple packing)
+        position = self.navigator.position
+        self.ue.set_location(position.x, position.y, unreal_z)
 
     def sync_box_position_to_unreal(self) -> None:
         """Move Boxsim agent to match Unreal Agent Position"""
@@ -97,7 +123,7 @@ class UENavigatorWrapper:
     def sync_rotation(self) -> None:
         """Sync UE agent location to box agent."""
         # Conversion from Box to unreal location is (180 - boxYaw) = unrealYaw
-        unreal_yaw: float = degrees(self.navigator.rotation)
+        unreal_yaw: float = self.navigator.rotation * _RAD_TO_DEG
         self.ue.set_yaw(unreal_yaw)
 
     def take_action(self) -> tuple[Action, Action]:
@@ -117,43 +143,79 @@ class UENavigatorWrapper:
             # A short delay to allow UE to render the scene after teleport
             sleep(0.1)
 
-        if action_taken == Action.FORWARD:
-            """_summary_ This method is first getting the length of the raycast between
-            the robot and any obstacle that may be in front of it and adds 1 to its
-            number of actions taken counter. If the raycast returns 0 this means there
-            is nothing in front of the robot and it's movement forward is valid so it
-            resets its actions taken to 0 and moves forward. However, if it is not valid
-            we instead get the location at this point in time and if after 10 forward
-            actions it is still unable to move forward, we compare it's position from
-            these two separate points in time and if it's less than a certain threshold
-            we'll set the stuck flag to True which will stop this trial early."""
-            self.num_stationary_moves += 1
-            if valid_movement is not False:
+        handler = self._ue_dispatch.get(action_taken)
+        if handler is None:
+            raise RuntimeError(f"Undefined action: {action_taken}")
+
+        # Send any buffered rotation once something other than another
+        # rotation is about to happen; test the action itself because
+        # attribute access rebinds methods, so `handler is self._ue_rotate`
+        # would never hold
+        if self._pending_yaw is not None and action_taken not in (
+            Action.ROTATE_LEFT,
+            Action.ROTATE_RIGHT,
+        ):
+            self.ue.set_yaw(self._pending_yaw)
+            self._pending_yaw = None
+
+        handler(valid_movement)
+
+        if self.dataset_path:
+            # Give UE time to render the action before the next image capture;
+            # the wait itself happens lazily in save_image
+            self._capture_deadline = max(self._capture_deadline, monotonic() + 0.25)
+
+        return action_taken, correct_action
+
+    def _ue_forward(self, valid_movement: bool) -> None:
+        """_summary_ This method is first getting the length of the raycast between
+        the robot and any obstacle that may be in front of it and adds 1 to its
+        number of actions taken counter. If the raycast returns 0 this means there
+        is nothing in front of the robot and it's movement forward is valid so it
+        resets its actions taken to 0 and moves forward. However, if it is not valid
+        we instead get the location at this point in time and if after 10 forward
+        actions it is still unable to move forward, we compare it's position from
+        these two separate points in time and if it's less than a certain threshold
+        we'll set the stuck flag to True which will stop this trial early."""
+        self.num_stationary_moves += 1
+        if valid_movement is not False:
+            if self._composite_step is not None:
+                # Single round-trip: raycast, move if clear, report location
+                raycast, (unreal_x, unreal_y, _) = self._composite_step(
+                    self.navigator.movement_increment
+                )
+            else:
                 raycast = self.ue.get_raycast_distance()
 
-                # Checks and sets a flag if we are stuck unable to move forward.
-                self.stuck = self.num_stationary_moves >= 10
-                # Sometimes large increments will hit the wall the target is on
-                if raycast == 0:
+            # Checks and sets a flag if we are stuck unable to move forward.
+            self.stuck = self.num_stationary_moves >= 10
+            # Sometimes large increments will hit the wall the target is on
+            if raycast == 0:
+                if self._composite_step is not None:
+                    self.navigator.position = Pt(unreal_x, unreal_y)
+                else:
                     self.ue.move_forward(self.navigator.movement_increment)
                     self.sync_box_position_to_unreal()
-                    self.num_stationary_moves = 0
-            else:
-                # In case an invalid move also causes to get stuck we are able to reset
-                self.stuck = self.num_stationary_moves >= 10
-        elif action_taken == Action.BACKWARD:
-            self.ue.move_backward(self.navigator.movement_increment)
-        elif action_taken == Action.ROTATE_LEFT:
-            self.sync_rotation()
-        elif action_taken == Action.ROTATE_RIGHT:
-            self.sync_rotation()
-        elif action_taken == Action.TELEPORT:
-            self.sync_positions()
+                self.num_stationary_moves = 0
+        else:
+            # In case an invalid move also causes to get stuck we are able to reset
+            self.stuck = self.num_stationary_moves >= 10
+
+    def _ue_backward(self, valid_movement: bool) -> None:
+        self.ue.move_backward(self.navigator.movement_increment)
+
+    def _ue_rotate(self, valid_movement: bool) -> None:
+        if self.dataset_path:
+            # Every step is captured, so the camera yaw must be current
             self.sync_rotation()
         else:
-            raise RuntimeError(f"Undefined action: {action_taken}")
+            # Back-to-back rotations only matter once the agent moves
+            # again; buffer the yaw and send a single OSC message then
+            self._pending_yaw = self.navigator.rotation * _RAD_TO_DEG
 
-        return action_taken, correct_action
+    def _ue_teleport(self, valid_movement: bool) -> None:
+        self.sync_positions()
+        self.sync_rotation()
 
     def save_image(self, action: Action) -> None:
         # # Rotations are swapped in UE
@@ -166,16 +228,22 @@ class UENavigatorWrapper:
         # Negative because unreal using a left-hand coordinate system
         angle = f"{-self.navigator.signed_angle_to_target:+.2f}".replace(".", "p")
         image_filepath = (
-            f"{self.dataset_path}/"
-            f"{self.trial_num:03}_{self.images_saved:06}_{angle}.{str(self.image_ext).lower()}"
+            f"{self._image_prefix}{self.images_saved:06}_{angle}.{self._image_ext_lower}"
         )
 
         # print(image_filepath)
 
         self.images_saved += 1
 
-        # Let teleport complete, save the image, then wait for image save
-        sleep(0.25)
+        # Block only for whatever settling time is still outstanding; the
+        # navigation work done since the last step overlaps most of it
+        remaining = self._capture_deadline - monotonic()
+        if remaining > 0:
+            sleep(remaining)
+
         self.ue.save_image(image_filepath)
         # TODO: maybe loop until the image exists?
-        sleep(0.25)
+
+        # The written image needs time to flush before the next capture; defer
+        # that wait to the next call so it overlaps with the UE commands
+        self._capture_deadline = monotonic() + 0.25
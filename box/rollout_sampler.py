@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from math import exp, floor, pi
+from typing import TYPE_CHECKING, MutableMapping
+
+if TYPE_CHECKING:
+    from .box import Pt
+
+"""
+rollout_sampler.py spreads parallel wandering rollouts over different branches.
+Workers share a visit-count table; actions already sampled by concurrent
+rollouts in the same state carry a "virtual loss" and are picked less often.
+"""
+
+
+class RolloutSampler:
+    """Biases random wandering actions away from already-sampled branches."""
+
+    def __init__(
+        self,
+        visit_counts: MutableMapping,
+        alpha: float = 1.0,
+        rotation_bins: int = 36,
+    ) -> None:
+        """Create a sampler over a visit-count mapping shared between workers.
+
+        Args:
+            visit_counts (MutableMapping): shared mapping from (state, action)
+                to in-flight visit counts, typically a Manager().dict()
+            alpha (float): virtual-loss weight; larger values spread harder
+            rotation_bins (int): heading discretization for the state key
+        """
+        self.visit_counts = visit_counts
+        self.alpha = alpha
+        self._bin_scale = rotation_bins / (2 * pi)
+
+        # Picks charged by this rollout, refunded by release()
+        self._picks: list[tuple] = []
+
+    def state_key(self, target: Pt, rotation: float) -> tuple[int, int, int]:
+        """Discretized state: the current target plus a binned heading."""
+        return round(target.x), round(target.y), floor(rotation * self._bin_scale)
+
+    def sample(self, state_key: tuple, num_actions: int, rand: float) -> int:
+        """Pick an action index given a uniform draw in [0, 1).
+
+        Actions are weighted by exp(-alpha * visits) so that branches other
+        workers are already exploring are sampled proportionally less often;
+        the pick is then charged to the shared table.
+        """
+        weights = [
+            exp(-self.alpha * self.visit_counts.get((state_key, a), 0))
+            for a in range(num_actions)
+        ]
+        threshold = rand * sum(weights)
+
+        pick = num_actions - 1
+        cumulative = 0.0
+        for action, weight in enumerate(weights):
+            cumulative += weight
+            if threshold < cumulative:
+                pick = action
+                break
+
+        key = (state_key, pick)
+        self.visit_counts[key] = self.visit_counts.get(key, 0) + 1
+        self._picks.append(key)
+        return pick
+
+    def release(self) -> None:
+        """Refund this rollout's virtual losses once it completes."""
+        for key in self._picks:
+            count = self.visit_counts.get(key, 0)
+            if count > 0:
+                self.visit_counts[key] = count - 1
+        self._picks.clear()
@@ -1,31 +1,70 @@
-import random
+import os
 from argparse import ArgumentParser, BooleanOptionalAction, Namespace
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from multiprocessing import Manager
 from math import radians
 from pathlib import Path
-from random import randrange
 
-import matplotlib.pyplot as plt
-from celluloid import Camera
+import numpy as np
 from tqdm import tqdm
 from ue5osc import TexturedSurface
 
-from box.box import Pt, aligned_box
+from box.box import Pt
 from box.boxenv import BoxEnv
 from box.boxnavigator import PerfectNavigator, TeleportingNavigator, WanderingNavigator
 from box.boxunreal import UENavigatorWrapper
+from box.rollout_sampler import RolloutSampler
+from box.routes import DEFAULT_ROUTE, ROUTES
 
-# TODO: this should probably be a command line argument (pass in a list of coordinates)
-# route 2, uses path w/ water fountain & stairs
-boxes = [
-    aligned_box(left=4640, right=5240, lower=110, upper=1510, target=(4940, 870)),
-    aligned_box(left=3720, right=5240, lower=700, upper=1040, target=(4000, 870)),
-    aligned_box(left=3850, right=4120, lower=360, upper=1040, target=(4000, 400)),
-    aligned_box(left=110, right=4120, lower=260, upper=540, target=(255, 400)),
-    aligned_box(left=150, right=400, lower=-1980, upper=540, target=(255, -1850)),
-    aligned_box(left=-1550, right=400, lower=-1980, upper=-1720, target=(-825, -1850)),
-    aligned_box(left=-900, right=-700, lower=-1980, upper=3320, target=(-825, 2485)),
-    aligned_box(left=-900, right=230, lower=2150, upper=2820, target=(150, 2485)),
-]
+# Kept for callers that import the default route directly
+boxes = ROUTES[DEFAULT_ROUTE]
+
+
+# End a trial once this many consecutive actions pass without the agent
+# making progress (getting measurably closer to the final target or entering
+# a later box on the route); a navigator oscillating in place would otherwise
+# burn the whole max_actions budget
+STALL_LIMIT = 250
+_STALL_EPSILON = 1.0
+
+# The environments are immutable once built (the boxes never change), so one
+# instance per route serves every trial in this process; workers each build
+# their own on first use rather than pickling one across process boundaries
+_box_envs: dict[str, BoxEnv] = {}
+
+
+def _shared_box_env(route: str) -> BoxEnv:
+    """The process-wide BoxEnv for the given route, built on first use."""
+    if route not in _box_envs:
+        _box_envs[route] = BoxEnv(ROUTES[route])
+    return _box_envs[route]
+
+
+# Rendered static scenes shared by every trial in this process: a route's
+# boxes never change between trials, so the figure and its background render
+# are produced once per route and reused (see _static_scene)
+_static_scene_cache: dict[int, tuple] = {}
+
+
+def _static_scene(box_env: BoxEnv):
+    """Figure, axes, and rendered background for the static box scene.
+
+    Cached for the lifetime of the process so that repeated trials skip both
+    the figure construction and the full render of the static outlines.
+    """
+    # Deferred so headless runs never pay the matplotlib import
+    import matplotlib.pyplot as plt
+
+    key = id(box_env)
+    if key not in _static_scene_cache:
+        fig, ax = plt.subplots()
+        box_env.display(ax)
+        ax.invert_xaxis()
+        fig.canvas.draw()
+        background = fig.canvas.copy_from_bbox(fig.bbox)
+        _static_scene_cache[key] = (fig, ax, background)
+    return _static_scene_cache[key]
 
 
 def check_path(directory: str) -> None:
@@ -33,17 +72,20 @@ def check_path(directory: str) -> None:
     # Create directory if it doesn't exist
     path.mkdir(parents=True, exist_ok=True)
 
-    # Check if directory is empty
-    if len(list(Path(path).iterdir())) != 0:
+    # Check if directory is empty; any() stops at the first entry instead of
+    # materializing the whole listing
+    if any(path.iterdir()):
         raise ValueError(f"Directory {path} is not empty.")
 
 
-def simulate(args: Namespace, trial_num: int) -> None:
+def simulate(
+    args: Namespace, trial_num: int, visit_counts: dict | None = None
+) -> tuple[bool, int]:
     """Create and update the box environment and run the navigator."""
 
-    box_env = BoxEnv(boxes)
+    box_env = _shared_box_env(args.route)
 
-    starting_box = boxes[0]
+    starting_box = box_env.boxes[0]
     initial_x = starting_box.left + starting_box.width / 2
     initial_y = starting_box.lower + 50
     initial_position = Pt(initial_x, initial_y)
@@ -58,6 +100,23 @@ def simulate(args: Namespace, trial_num: int) -> None:
     else:
         raise ValueError("Invalid value for navigator.")
 
+    # Reproducibility is opt-in: with --seed, each trial derives its own
+    # child seeds (navigator, texture randomization) so parallel rollouts do
+    # not share a stream; without it every run uses fresh entropy
+    nav_seed = texture_seed = None
+    if args.seed is not None:
+        nav_seed, texture_seed = (
+            int(s)
+            for s in np.random.SeedSequence([args.seed, trial_num]).generate_state(2)
+        )
+
+    extra_kwargs = {}
+    if args.navigator in ("wandering", "teleport"):
+        extra_kwargs["seed"] = nav_seed
+    if args.navigator == "wandering" and visit_counts is not None:
+        # Spread concurrent rollouts over different branches
+        extra_kwargs["rollout_sampler"] = RolloutSampler(visit_counts)
+
     agent = NavigatorConstructor(
         initial_position,
         initial_rotation,
@@ -65,6 +124,7 @@ def simulate(args: Namespace, trial_num: int) -> None:
         args.distance_threshold,
         args.movement_increment,
         args.rotation_increment,
+        **extra_kwargs,
     )
 
     # Wrap the agent if we want to connect to Unreal Engine
@@ -83,8 +143,48 @@ def simulate(args: Namespace, trial_num: int) -> None:
 
     is_ue_navigator = isinstance(agent, UENavigatorWrapper)
 
-    fig, ax = plt.subplots()
-    camera = Camera(fig)
+    # Stream animation frames straight to disk instead of snapshotting every
+    # frame in memory (as celluloid's Camera did); the static scene is drawn
+    # once and only the agent's artists change per frame. No figure is
+    # created at all unless an animation was requested
+    animate = bool(args.anim_ext)
+    writer = None
+    blit_frames = None
+    if animate:
+        # Reserve the name atomically: concurrent trials all scan before any
+        # animation is written, so an exists() probe would hand every worker
+        # the same name and the last writer would overwrite the rest
+        output_filename = None
+        num = 1
+        while output_filename is None:
+            candidate = f"output_{num}.{args.anim_ext}"
+            try:
+                with open(candidate, "x"):
+                    pass
+                output_filename = candidate
+            except FileExistsError:
+                num += 1
+
+        if args.anim_ext == "gif":
+            # GIF frames sit in memory until the end either way (PillowWriter
+            # buffers them too), so capture blitted buffers directly: the
+            # static scene is rendered once per process, cached, and each
+            # frame restores it and redraws only the agent's artists
+            from PIL import Image
+
+            fig, ax, background = _static_scene(box_env)
+            blit_frames = []
+        else:
+            # The video writer renders through savefig, which redraws every
+            # artist on the axes, so each trial gets a fresh figure
+            import matplotlib.pyplot as plt
+            from matplotlib.animation import FFMpegWriter
+
+            fig, ax = plt.subplots()
+            box_env.display(ax)
+            ax.invert_xaxis()
+            writer = FFMpegWriter(fps=20)
+            writer.setup(fig, output_filename)
 
     """
     import enlighten
@@ -103,40 +203,130 @@ def simulate(args: Namespace, trial_num: int) -> None:
 
     manager.stop()
     """
-    for _ in tqdm(range(args.max_actions)):
-    # while not agent.stuck and (
-    #     not agent.at_final_target() and agent.num_actions_taken() < args.max_actions
-    # ):
-        if agent.stuck:
-            break
-
-        if agent.at_final_target():
-            break
-
-        try:
-            _ = agent.take_action()
-        except TimeoutError as e:
-            print(e)
-            if is_ue_navigator:
-                agent.ue.close_osc()
-            raise SystemExit
-        except Exception as e:
-            print(e)
-            if is_ue_navigator:
-                agent.ue.close_osc()
-            raise SystemExit
+    # Pre-draw every texture randomization decision for the trial in two
+    # vectorized calls; the loop then just indexes into the arrays instead of
+    # rebuilding the surface list and drawing from the random module each time
+    texture_executor = None
+    if is_ue_navigator and args.randomize:
+        surfaces = list(TexturedSurface)
+        texture_rng = np.random.default_rng(texture_seed)
+        num_changes = args.max_actions // 20 + 1
+        surface_picks = texture_rng.integers(0, len(surfaces), num_changes)
+        texture_picks = texture_rng.integers(0, 42, num_changes)
+        texture_index = 0
+
+        # Texture changes are fire-and-forget, so a single worker thread
+        # issues them while the step loop keeps going instead of the loop
+        # stalling on each OSC send
+        texture_executor = ThreadPoolExecutor(max_workers=1)
+
+    # The final target never moves, so hoist its coordinates and the squared
+    # threshold out of the loop and inline the distance check instead of
+    # dispatching agent.at_final_target() every iteration
+    final_target = box_env.boxes[-1].target
+    fx, fy = final_target.x, final_target.y
+    threshold_sq = args.distance_threshold * args.distance_threshold
+
+    # Early-termination bookkeeping: the best squared distance to the final
+    # target seen so far and how many steps have passed since it improved.
+    # Straight-line distance alone is not a progress measure on a winding
+    # route (parts of route2 move away from the final target under perfect
+    # play), so entering a box further along the route also counts as
+    # progress and restarts the distance baseline
+    box_order = {id(box): i for i, box in enumerate(box_env.boxes)}
+    best_box_index = -1
+    best_distance_sq = float("inf")
+    stale_steps = 0
+    stalled = False
+
+    # The writer streams to disk, so finish it even when a trial aborts
+    # early; whatever frames were grabbed are still flushed into a playable
+    # animation
+    try:
+        for _ in tqdm(range(args.max_actions)):
+        # while not agent.stuck and (
+        #     not agent.at_final_target() and agent.num_actions_taken() < args.max_actions
+        # ):
+            if agent.stuck:
+                break
+
+            position = agent.position
+            dx = position.x - fx
+            dy = position.y - fy
+            distance_sq = dx * dx + dy * dy
+            if distance_sq < threshold_sq:
+                break
+
+            box_index = box_order.get(id(agent.current_box), -1)
+            if box_index > best_box_index:
+                best_box_index = box_index
+                best_distance_sq = distance_sq
+                stale_steps = 0
+            elif distance_sq < best_distance_sq - _STALL_EPSILON:
+                best_distance_sq = distance_sq
+                stale_steps = 0
+            else:
+                stale_steps += 1
+                if stale_steps >= STALL_LIMIT:
+                    stalled = True
+                    break
+
+            try:
+                _ = agent.take_action()
+            except TimeoutError as e:
+                print(e)
+                if is_ue_navigator:
+                    agent.ue.close_osc()
+                raise SystemExit
+            except Exception as e:
+                print(e)
+                if is_ue_navigator:
+                    agent.ue.close_osc()
+                raise SystemExit
 
-        if is_ue_navigator:
-            if agent.num_actions_taken() % 20 == 0 and args.randomize:
-                random_surface = random.choice(list(TexturedSurface))
-                agent.ue.set_texture(random_surface, randrange(42))
-
-        if args.anim_ext:
-            # TODO: Rotate axis so that agent is always facing up
-            box_env.display(ax)
-            agent.display(ax, 300)
-            ax.invert_xaxis()
-            camera.snap()
+            if is_ue_navigator:
+                if args.randomize and agent.num_actions_taken() % 20 == 0:
+                    texture_executor.submit(
+                        agent.ue.set_texture,
+                        surfaces[surface_picks[texture_index]],
+                        int(texture_picks[texture_index]),
+                    )
+                    texture_index += 1
+
+            if animate:
+                # TODO: Rotate axis so that agent is always facing up
+                agent.display(ax, 300)
+                if blit_frames is not None:
+                    fig.canvas.restore_region(background)
+                    agent.draw_artists()
+                    fig.canvas.blit(fig.bbox)
+                    blit_frames.append(
+                        Image.fromarray(np.asarray(fig.canvas.buffer_rgba()).copy())
+                    )
+                else:
+                    writer.grab_frame()
+    finally:
+        if texture_executor is not None:
+            # Drain any in-flight texture sends before the OSC link closes
+            texture_executor.shutdown(wait=True)
+        if writer is not None:
+            writer.finish()
+            # Release the per-trial video figure from pyplot's global
+            # registry; without this, repeated trials accumulate figures
+            # (the cached GIF-path figure is shared on purpose and stays)
+            plt.close(fig)
+        elif blit_frames is not None:
+            # The GIF figure is shared across trials; take this trial's agent
+            # artists down so they don't accumulate on the cached axes
+            agent.remove_artists()
+            if blit_frames:
+                blit_frames[0].save(
+                    output_filename,
+                    save_all=True,
+                    append_images=blit_frames[1:],
+                    duration=1000 // 20,
+                    loop=0,
+                )
 
     if isinstance(agent, UENavigatorWrapper):
         agent.ue.close_osc()
@@ -146,19 +336,73 @@ def simulate(args: Namespace, trial_num: int) -> None:
     num_actions = agent.num_actions_taken()
     if agent.at_final_target():
         print(f"Agent reached final target in {num_actions} actions.")
+    elif stalled:
+        print(
+            f"Agent made no progress for {STALL_LIMIT} actions; "
+            f"trial ended early after {num_actions} actions."
+        )
     else:
         print(f"Agent was unable to reach final target within {num_actions} actions.")
 
-    if args.anim_ext:
-        output_filename = None
-        num = 1
-        while not output_filename or Path(output_filename).exists():
-            output_filename = f"output_{num}.{args.anim_ext}"
-            num += 1
-        anim = camera.animate()
-        anim.save(output_filename)
+    success = agent.at_final_target()
+
+    sampler = extra_kwargs.get("rollout_sampler")
+    if sampler is not None:
+        sampler.release()
+
+    if animate:
         print(f"Animation saved to {output_filename}.")
 
+    return success, num_actions
+
+
+def _run_one_trial(
+    args: Namespace, trial_num: int, visit_counts: dict | None
+) -> tuple[bool, int]:
+    """Run a single trial in a worker process.
+
+    All randomness flows through per-navigator numpy generators created in
+    simulate() (seeded only when --seed is given), so no global seeding is
+    needed here.
+    """
+    return simulate(args, trial_num, visit_counts)
+
+
+def run_rollouts(args: Namespace) -> None:
+    """Run the trials as independent processes and report the success rate.
+
+    Trials are embarrassingly parallel when not tied to a (single) Unreal
+    Engine instance, so spread them over the available cores.
+    """
+    # Wandering workers share a visit-count table so their random exploration
+    # does not redundantly cover the same branches (see box/rollout_sampler.py)
+    visit_counts = None
+    if args.navigator == "wandering":
+        visit_counts = Manager().dict()
+
+    num_workers = min(args.num_trials, os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        results = list(
+            executor.map(
+                _run_one_trial,
+                repeat(args),
+                range(1, args.num_trials + 1),
+                repeat(visit_counts),
+            )
+        )
+
+    _print_summary(results)
+
+
+def _print_summary(results: list[tuple[bool, int]]) -> None:
+    """Print the success rate and mean action count over a set of trials."""
+    num_successes = sum(1 for success, _ in results if success)
+    mean_actions = sum(num_actions for _, num_actions in results) / len(results)
+    print(
+        f"{num_successes}/{len(results)} trials reached the final target "
+        f"(mean actions: {mean_actions:.1f})."
+    )
+
 
 def main():
     """Parse arguments and run simulation."""
@@ -177,6 +421,14 @@ def main():
 
     argparser.add_argument("--anim_ext", type=str, help="Output format for animation.")
 
+    argparser.add_argument(
+        "--route",
+        type=str,
+        choices=sorted(ROUTES),
+        default=DEFAULT_ROUTE,
+        help="Pre-registered box route to navigate.",
+    )
+
     argparser.add_argument(
         "--max_actions", type=int, default=10, help="Maximum allowed actions."
     )
@@ -235,6 +487,13 @@ def main():
         help="Determines how close the robot has to be to the target to activate the next one.",
     )
 
+    argparser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Base seed for reproducible trials (default: fresh entropy).",
+    )
+
     argparser.add_argument(
         "--randomize",
         type=bool,
@@ -257,8 +516,14 @@ def main():
     if args.save_images:
         check_path(args.save_images)
 
-    for trial in range(1, args.num_trials + 1):
-        simulate(args, trial)
+    # Trials that talk to Unreal Engine share one game instance and must run
+    # sequentially; pure-Python trials can fan out across processes
+    if args.ue or args.num_trials == 1:
+        results = [simulate(args, trial) for trial in range(1, args.num_trials + 1)]
+        if args.num_trials > 1:
+            _print_summary(results)
+    else:
+        run_rollouts(args)
 
 
 if __name__ == "__main__":
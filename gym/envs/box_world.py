@@ -11,6 +11,7 @@ https://gymnasium.farama.org/tutorials/gymnasium_basics/environment_creation/
 # - ue5osc
 # - specific python version?
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from time import sleep
 
@@ -42,10 +43,19 @@ class BoxWorldEnv(gym.Env):
             raise SystemExit
 
         self.episode = 0
+
+        # Reusable observation buffer: each step decodes the captured image
+        # into this array instead of allocating a fresh ~1 MB observation
+        self._obs = np.empty((500, 700, 3), dtype=np.uint8)
+
+        # Single worker so at most one capture is in flight; step() overlaps
+        # the capture (render, transmit, settle) with its reward computation
+        self._obs_executor = ThreadPoolExecutor(max_workers=1)
+
         self.reset()
 
         self.observation_space = spaces.Box(
-            low=0, high=255, shape=(500, 700, 3), dtype=np.uint8
+            low=0, high=255, shape=self._obs.shape, dtype=np.uint8
         )
 
         # The 'agent' can take 4 actions: move forward, move backward, turn left, turn right
@@ -71,9 +81,11 @@ class BoxWorldEnv(gym.Env):
         # For example, loop until the file exists (file will exist on creation not being filled)
         sleep(0.5)
 
-        # TODO: maybe convert to numpy array before returning
-        image = Image.open(image_filename)
-        return image
+        # Decode into the preallocated buffer; [..., :3] drops the alpha
+        # channel if the capture includes one
+        frame = np.asarray(Image.open(image_filename))
+        self._obs[:] = frame[..., :3]
+        return self._obs
         # TODO: also return location?
         # return {"agent": self._agent_location, "target": self._target_location}
 
@@ -122,7 +134,9 @@ class BoxWorldEnv(gym.Env):
             case _:
                 raise RuntimeError("Invalid code path.")
 
-        observation = self._get_obs()
+        # Kick off the capture immediately so UE renders and transmits while
+        # Python computes the rest of the step below
+        obs_future = self._obs_executor.submit(self._get_obs)
         info = self._get_info()
 
         # TODO:
@@ -136,11 +150,12 @@ class BoxWorldEnv(gym.Env):
         # TODO: detect if getting stuck
         truncated = False
 
-        return observation, reward, terminated, truncated, info
+        return obs_future.result(), reward, terminated, truncated, info
 
     def render(self, mode="human"):
         raise NotImplementedError
 
     def close(self):
+        self._obs_executor.shutdown(wait=True)
         # TODO: Close UE game binary? (handle in ue5osc?)
         self.ue.close_osc()
@@ -0,0 +1,20 @@
+"""Optional build of the Cython geometry kernels.
+
+Run `python setup.py build_ext --inplace` to compile box/_ckernels.pyx; the
+simulator then imports the extension instead of JIT-compiling the Numba
+kernels at startup. Without Cython (or without building), everything still
+works through the Numba fallback in box/_nkernels.py.
+"""
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [Extension("box._ckernels", ["box/_ckernels.pyx"])]
+    )
+except ImportError:
+    ext_modules = []
+
+setup(name="boxnav", ext_modules=ext_modules)